@@ -29,10 +29,33 @@ Usage:
 __version__ = "0.2.0"
 __author__ = "Asher Informatics PBC"
 
-from ashmatics_datamodels.common import AshMaticsBaseModel, TimestampedModel
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ashmatics_datamodels.common.base import AshMaticsBaseModel, TimestampedModel
+
+# Resolved lazily (PEP 562) so `import ashmatics_datamodels` stays cheap
+_LAZY_IMPORTS: dict[str, str] = {
+    "AshMaticsBaseModel": "ashmatics_datamodels.common.base",
+    "TimestampedModel": "ashmatics_datamodels.common.base",
+}
 
 __all__ = [
     "__version__",
     "AshMaticsBaseModel",
     "TimestampedModel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
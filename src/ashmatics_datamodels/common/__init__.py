@@ -14,53 +14,122 @@
 
 """
 Common base models and utilities shared across all jurisdictions.
+
+Exports are resolved lazily (PEP 562): importing this package does not
+import the regulator and framework schema modules until one of their
+names is first accessed.
 """
 
-from ashmatics_datamodels.common.base import (
-    AshMaticsBaseModel,
-    AuditedModel,
-    TimestampedModel,
-)
-from ashmatics_datamodels.common.enums import (
-    AuthorizationStatus,
-    ParsingStatus,
-    Region,
-    RegulatoryStatus,
-    RiskCategory,
-)
-from ashmatics_datamodels.common.frameworks import (
-    RegulatoryFrameworkBase,
-    RegulatoryFrameworkCreate,
-    RegulatoryFrameworkResponse,
-    RegulatoryFrameworkStats,
-    RegulatoryFrameworkSummary,
-    RegulatoryFrameworkUpdate,
-)
-from ashmatics_datamodels.common.regulators import (
-    RegulatorBase,
-    RegulatorCreate,
-    RegulatorResponse,
-    RegulatorStats,
-    RegulatorSummary,
-    RegulatorUpdate,
-)
-from ashmatics_datamodels.common.validators import (
-    validate_country_code,
-    validate_iso_date,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ashmatics_datamodels.common.base import (
+        AshMaticsBaseModel,
+        AuditedModel,
+        TimestampedModel,
+        to_json,
+    )
+    from ashmatics_datamodels.common.enums import (
+        AuthorizationStatus,
+        AuthorizationStatusLiteral,
+        ParsingStatus,
+        ParsingStatusLiteral,
+        Region,
+        RegionLiteral,
+        RegulatoryStatus,
+        RegulatoryStatusLiteral,
+        RiskCategory,
+        RiskCategoryLiteral,
+    )
+    from ashmatics_datamodels.common.frameworks import (
+        RegulatoryFrameworkBase,
+        RegulatoryFrameworkCreate,
+        RegulatoryFrameworkResponse,
+        RegulatoryFrameworkStats,
+        RegulatoryFrameworkSummary,
+        RegulatoryFrameworkUpdate,
+    )
+    from ashmatics_datamodels.common.regulators import (
+        RegulatorBase,
+        RegulatorCreate,
+        RegulatorResponse,
+        RegulatorStats,
+        RegulatorSummary,
+        RegulatorUpdate,
+    )
+    from ashmatics_datamodels.common.validators import (
+        CountryCode,
+        validate_country_code,
+        validate_iso_date,
+    )
+
+# Submodule -> exported names, resolved on first attribute access
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "ashmatics_datamodels.common.base": (
+        "AshMaticsBaseModel",
+        "AuditedModel",
+        "TimestampedModel",
+        "to_json",
+    ),
+    "ashmatics_datamodels.common.enums": (
+        "AuthorizationStatus",
+        "AuthorizationStatusLiteral",
+        "ParsingStatus",
+        "ParsingStatusLiteral",
+        "Region",
+        "RegionLiteral",
+        "RegulatoryStatus",
+        "RegulatoryStatusLiteral",
+        "RiskCategory",
+        "RiskCategoryLiteral",
+    ),
+    "ashmatics_datamodels.common.frameworks": (
+        "RegulatoryFrameworkBase",
+        "RegulatoryFrameworkCreate",
+        "RegulatoryFrameworkResponse",
+        "RegulatoryFrameworkStats",
+        "RegulatoryFrameworkSummary",
+        "RegulatoryFrameworkUpdate",
+    ),
+    "ashmatics_datamodels.common.regulators": (
+        "RegulatorBase",
+        "RegulatorCreate",
+        "RegulatorResponse",
+        "RegulatorStats",
+        "RegulatorSummary",
+        "RegulatorUpdate",
+    ),
+    "ashmatics_datamodels.common.validators": (
+        "CountryCode",
+        "validate_country_code",
+        "validate_iso_date",
+    ),
+}
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
 __all__ = [
     # Base models
     "AshMaticsBaseModel",
     "TimestampedModel",
     "AuditedModel",
+    "to_json",
     # Enums
     "AuthorizationStatus",
     "RegulatoryStatus",
     "RiskCategory",
     "ParsingStatus",
     "Region",
+    # Literal aliases of the enums above
+    "AuthorizationStatusLiteral",
+    "RegulatoryStatusLiteral",
+    "RiskCategoryLiteral",
+    "ParsingStatusLiteral",
+    "RegionLiteral",
     # Validators
+    "CountryCode",
     "validate_country_code",
     "validate_iso_date",
     # Regulators
@@ -78,3 +147,16 @@ __all__ = [
     "RegulatoryFrameworkSummary",
     "RegulatoryFrameworkStats",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -19,11 +19,19 @@ These models are database-agnostic and provide common configuration
 and functionality across all domain-specific schemas.
 """
 
+import os
 from datetime import datetime
 from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Assignment validation re-runs field validation on every attribute write.
+# Bulk pipelines that mutate large numbers of already-validated instances
+# can switch it off with ASHMATICS_VALIDATE_ASSIGNMENT=0 (read at import).
+VALIDATE_ASSIGNMENT = os.environ.get(
+    "ASHMATICS_VALIDATE_ASSIGNMENT", "1"
+).strip().lower() not in ("0", "false", "no", "off")
+
 
 class AshMaticsBaseModel(BaseModel):
     """
@@ -31,18 +39,30 @@ class AshMaticsBaseModel(BaseModel):
 
     Configuration:
         - from_attributes: Enable ORM mode for SQLAlchemy integration in apps
-        - validate_assignment: Validate on field assignment
+        - validate_assignment: Validate on field assignment (on unless
+          ASHMATICS_VALIDATE_ASSIGNMENT is set to 0/false)
         - use_enum_values: Use enum values, not names, in serialization
         - extra: Forbid extra fields by default for strict validation
         - str_strip_whitespace: Strip whitespace from string fields
+        - defer_build: Build validators/serializers on first use rather than
+          at class definition, so importing a module only pays for the
+          schemas that are actually exercised
+
+    Serialize to JSON with ``model_dump_json()`` (or ``to_json()`` for
+    bytes) rather than ``json.dumps(model.model_dump())``; the former runs
+    in a single pass in pydantic-core without building an intermediate
+    Python dict. Likewise, parse JSON strings/bytes (HTTP bodies, cache
+    entries, exported documents) with ``Model.model_validate_json(raw)``
+    instead of ``Model.model_validate(json.loads(raw))``.
     """
 
     model_config = ConfigDict(
         from_attributes=True,
-        validate_assignment=True,
+        validate_assignment=VALIDATE_ASSIGNMENT,
         use_enum_values=True,
         extra="forbid",
         str_strip_whitespace=True,
+        defer_build=True,
     )
 
 
@@ -74,3 +94,22 @@ class AuditedModel(TimestampedModel):
     updated_by: Optional[str] = Field(
         None, description="User ID or system identifier who last updated the record"
     )
+
+
+def to_json(model: BaseModel, *, by_alias: bool = True) -> bytes:
+    """
+    Serialize a model to JSON bytes using pydantic-core's serializer.
+
+    Equivalent to ``model.model_dump_json(by_alias=by_alias).encode()``
+    without the round trip through ``str``, for callers that write bytes
+    (HTTP responses, message queues, files).
+
+    Args:
+        model: Any AshMatics model instance
+        by_alias: Use field aliases (e.g., ``_id``), matching the
+            ``model_dump(by_alias=True)`` convention used for storage
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    return model.__pydantic_serializer__.to_json(model, by_alias=by_alias)
@@ -17,9 +17,15 @@ Common enumerations shared across jurisdictions.
 
 These enums represent concepts that are jurisdiction-agnostic or
 shared across multiple regulatory frameworks.
+
+Each enum has a parallel ``*Literal`` alias over the same values. Use the
+enum in Python code; use the Literal as a Pydantic field type where a
+plain membership check is enough (pydantic-core validates a Literal with
+a single set lookup instead of enum member resolution).
 """
 
 from enum import Enum
+from typing import Literal
 
 
 class AuthorizationStatus(str, Enum):
@@ -41,6 +47,15 @@ class AuthorizationStatus(str, Enum):
     UNDER_REVIEW = "under_review"  # Application under regulatory review
 
 
+AuthorizationStatusLiteral = Literal[
+    "active",
+    "expired",
+    "withdrawn",
+    "suspended",
+    "under_review",
+]
+
+
 class RegulatoryStatus(str, Enum):
     """
     Overall regulatory standing of a product across jurisdictions.
@@ -61,6 +76,15 @@ class RegulatoryStatus(str, Enum):
     SUSPENDED = "suspended"  # Product marketing suspended by authority
 
 
+RegulatoryStatusLiteral = Literal[
+    "approved",
+    "pending",
+    "rejected",
+    "withdrawn",
+    "suspended",
+]
+
+
 class RiskCategory(str, Enum):
     """
     General risk categorization for medical devices.
@@ -78,6 +102,9 @@ class RiskCategory(str, Enum):
     HIGH = "high"  # Significant potential for harm (Class III)
 
 
+RiskCategoryLiteral = Literal["low", "moderate", "high"]
+
+
 class ParsingStatus(str, Enum):
     """
     Document parsing workflow status.
@@ -98,6 +125,15 @@ class ParsingStatus(str, Enum):
     SKIPPED = "skipped"  # Document intentionally not parsed
 
 
+ParsingStatusLiteral = Literal[
+    "pending",
+    "in_progress",
+    "completed",
+    "failed",
+    "skipped",
+]
+
+
 class Region(str, Enum):
     """
     Geographic regions for manufacturer categorization.
@@ -117,3 +153,18 @@ class Region(str, Enum):
     JP = "JP"
     KR = "KR"
     OTHER = "OTHER"
+
+
+RegionLiteral = Literal[
+    "USA",
+    "EU",
+    "DE",
+    "UK",
+    "CHINA",
+    "APAC",
+    "LATAM",
+    "AUS",
+    "JP",
+    "KR",
+    "OTHER",
+]
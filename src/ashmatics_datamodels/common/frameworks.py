@@ -22,8 +22,8 @@ Migrated from: KB src/app/schemas/regulatory_framework_schema.py
 JIRA: ASHKBAPP-28 (Phase 2.1)
 """
 
-from datetime import datetime
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, Optional
 
 from pydantic import Field
 
@@ -132,10 +132,26 @@ class RegulatoryFrameworkResponse(RegulatoryFrameworkBase, TimestampedModel):
         0, description="Number of authorizations under this framework"
     )
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "RegulatoryFrameworkResponse":
+        """
+        Build a response from an already-validated database row.
+
+        Uses ``model_construct`` and skips validation entirely. Only use
+        for trusted reads of data that was validated on write; anything
+        from outside the database must go through ``model_validate``.
+
+        Nested values are not converted either: ``regulator`` must already
+        be a ``RegulatorSummary`` (or None), not a dict.
+        """
+        return cls.model_construct(**dict(row))
+
 
 class RegulatoryFrameworkSummary(AshMaticsBaseModel):
     """Minimal framework information for nested responses."""
 
+    model_config = {"frozen": True}  # Read-only response DTO
+
     id: int
     framework_code: str
     framework_name: str
@@ -146,6 +162,8 @@ class RegulatoryFrameworkSummary(AshMaticsBaseModel):
 class RegulatoryFrameworkStats(AshMaticsBaseModel):
     """Schema for regulatory framework statistics."""
 
+    model_config = {"frozen": True}  # Read-only response DTO
+
     total_frameworks: int = Field(..., description="Total number of frameworks")
     active_frameworks: int = Field(..., description="Number of active frameworks")
     by_authorization_type: dict[str, int] = Field(
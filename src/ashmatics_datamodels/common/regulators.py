@@ -22,13 +22,13 @@ Migrated from: KB src/app/schemas/regulator_schema.py
 JIRA: ASHKBAPP-28 (Phase 2.1)
 """
 
-from datetime import datetime
-from typing import Optional
+from collections.abc import Mapping
+from typing import Any, Optional
 
-from pydantic import Field, HttpUrl, field_validator
+from pydantic import Field, field_validator
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel, TimestampedModel
-from ashmatics_datamodels.common.validators import validate_country_code
+from ashmatics_datamodels.common.validators import CountryCode, validate_http_url
 
 
 class RegulatorBase(AshMaticsBaseModel):
@@ -54,9 +54,8 @@ class RegulatorBase(AshMaticsBaseModel):
         max_length=500,
         description="Complete official name",
     )
-    country_code: Optional[str] = Field(
+    country_code: CountryCode = Field(
         None,
-        max_length=2,
         description="ISO 3166-1 alpha-2 country code (e.g., 'US', 'DE')",
     )
     region: Optional[str] = Field(
@@ -79,16 +78,20 @@ class RegulatorBase(AshMaticsBaseModel):
         description="Whether regulator is currently active",
     )
 
-    @field_validator("country_code")
-    @classmethod
-    def validate_country(cls, v: Optional[str]) -> Optional[str]:
-        return validate_country_code(v)
-
 
 class RegulatorCreate(RegulatorBase):
-    """Schema for creating a new regulator."""
+    """
+    Schema for creating a new regulator.
 
-    pass
+    URLs must be http(s) on write. The check lives here and on
+    RegulatorUpdate rather than on RegulatorBase, so RegulatorResponse
+    still reads rows stored before it was introduced.
+    """
+
+    @field_validator("website", "api_endpoint")
+    @classmethod
+    def validate_url(cls, v: Optional[str]) -> Optional[str]:
+        return validate_http_url(v)
 
 
 class RegulatorUpdate(AshMaticsBaseModel):
@@ -99,12 +102,17 @@ class RegulatorUpdate(AshMaticsBaseModel):
     code: Optional[str] = Field(None, max_length=20)
     name: Optional[str] = Field(None, max_length=255)
     full_name: Optional[str] = Field(None, max_length=500)
-    country_code: Optional[str] = Field(None, max_length=2)
+    country_code: CountryCode = None
     region: Optional[str] = Field(None, max_length=50)
     website: Optional[str] = None
     api_endpoint: Optional[str] = None
     is_active: Optional[bool] = None
 
+    @field_validator("website", "api_endpoint")
+    @classmethod
+    def validate_url(cls, v: Optional[str]) -> Optional[str]:
+        return validate_http_url(v)
+
 
 class RegulatorResponse(RegulatorBase, TimestampedModel):
     """
@@ -123,10 +131,23 @@ class RegulatorResponse(RegulatorBase, TimestampedModel):
         0, description="Number of classification systems managed"
     )
 
+    @classmethod
+    def from_row(cls, row: Mapping[str, Any]) -> "RegulatorResponse":
+        """
+        Build a response from an already-validated database row.
+
+        Uses ``model_construct`` and skips validation entirely. Only use
+        for trusted reads of data that was validated on write; anything
+        from outside the database must go through ``model_validate``.
+        """
+        return cls.model_construct(**dict(row))
+
 
 class RegulatorSummary(AshMaticsBaseModel):
     """Minimal regulator information for nested responses."""
 
+    model_config = {"frozen": True}  # Read-only response DTO
+
     id: int
     code: str
     name: str
@@ -136,6 +157,8 @@ class RegulatorSummary(AshMaticsBaseModel):
 class RegulatorStats(AshMaticsBaseModel):
     """Schema for regulator statistics."""
 
+    model_config = {"frozen": True}  # Read-only response DTO
+
     total_regulators: int = Field(..., description="Total number of regulators")
     active_regulators: int = Field(..., description="Number of active regulators")
     by_region: dict[str, int] = Field(
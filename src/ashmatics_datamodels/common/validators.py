@@ -21,56 +21,69 @@ for common validation patterns.
 
 import re
 from datetime import date, datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Annotated, Optional
+
+from pydantic import AfterValidator, Field
 
 # ISO 3166-1 alpha-2 country codes (commonly used subset)
 # Full list available at: https://www.iso.org/iso-3166-country-codes.html
-VALID_COUNTRY_CODES = {
-    "US",
-    "CA",
-    "MX",  # North America
-    "GB",
-    "DE",
-    "FR",
-    "IT",
-    "ES",
-    "NL",
-    "BE",
-    "CH",
-    "AT",
-    "SE",
-    "NO",
-    "DK",
-    "FI",
-    "IE",
-    "PL",
-    "CZ",
-    "PT",  # Europe
-    "CN",
-    "JP",
-    "KR",
-    "IN",
-    "AU",
-    "NZ",
-    "SG",
-    "HK",
-    "TW",
-    "TH",
-    "MY",
-    "ID",
-    "PH",
-    "VN",  # Asia-Pacific
-    "BR",
-    "AR",
-    "CL",
-    "CO",
-    "PE",  # Latin America
-    "IL",
-    "AE",
-    "SA",
-    "ZA",
-    "EG",  # Middle East & Africa
-}
+VALID_COUNTRY_CODES: frozenset[str] = frozenset(
+    {
+        "US",
+        "CA",
+        "MX",  # North America
+        "GB",
+        "DE",
+        "FR",
+        "IT",
+        "ES",
+        "NL",
+        "BE",
+        "CH",
+        "AT",
+        "SE",
+        "NO",
+        "DK",
+        "FI",
+        "IE",
+        "PL",
+        "CZ",
+        "PT",  # Europe
+        "CN",
+        "JP",
+        "KR",
+        "IN",
+        "AU",
+        "NZ",
+        "SG",
+        "HK",
+        "TW",
+        "TH",
+        "MY",
+        "ID",
+        "PH",
+        "VN",  # Asia-Pacific
+        "BR",
+        "AR",
+        "CL",
+        "CO",
+        "PE",  # Latin America
+        "IL",
+        "AE",
+        "SA",
+        "ZA",
+        "EG",  # Middle East & Africa
+    }
+)
+
+# Precomputed once for the error path of validate_country_code
+_VALID_COUNTRY_CODES_MSG = ", ".join(sorted(VALID_COUNTRY_CODES))
+
+# FDA identifier patterns, compiled once at import
+# K, BK, or DEN followed by 6-7 digits
+_K_NUMBER_PATTERN = re.compile(r"^(K|BK|DEN)\d{6,7}$")
+_PMA_NUMBER_PATTERN = re.compile(r"^P\d{6}$")
 
 
 def validate_country_code(value: Optional[str]) -> Optional[str]:
@@ -89,7 +102,11 @@ def validate_country_code(value: Optional[str]) -> Optional[str]:
     if value is None:
         return None
 
-    normalized = value.upper().strip()
+    # Fast path: already-canonical input needs no strip/upper copies
+    if value in VALID_COUNTRY_CODES:
+        return value
+
+    normalized = value.strip().upper()
 
     if len(normalized) != 2:
         raise ValueError(
@@ -99,12 +116,39 @@ def validate_country_code(value: Optional[str]) -> Optional[str]:
     if normalized not in VALID_COUNTRY_CODES:
         raise ValueError(
             f"Invalid ISO 3166-1 country code '{value}'. "
-            f"Expected one of: {', '.join(sorted(VALID_COUNTRY_CODES))}"
+            f"Expected one of: {_VALID_COUNTRY_CODES_MSG}"
         )
 
     return normalized
 
 
+def validate_http_url(value: Optional[str]) -> Optional[str]:
+    """
+    Validate that a URL string uses an HTTP(S) scheme.
+
+    A lightweight prefix check used in place of pydantic's HttpUrl, which
+    builds a full parsed URL object for every value. Fields stay plain
+    strings; applications parse them further if needed.
+
+    Args:
+        value: URL string (e.g., 'https://www.fda.gov')
+
+    Returns:
+        URL unchanged if valid
+
+    Raises:
+        ValueError: If URL does not start with http:// or https://
+    """
+    if value is None:
+        return None
+
+    # URL schemes are case-insensitive (RFC 3986), so compare lowercased
+    if not value[:8].lower().startswith(("http://", "https://")):
+        raise ValueError(f"Invalid URL '{value}'. Expected an http:// or https:// URL")
+
+    return value
+
+
 def validate_iso_date(value: Optional[str]) -> Optional[date]:
     """
     Validate and parse ISO 8601 date string.
@@ -127,7 +171,25 @@ def validate_iso_date(value: Optional[str]) -> Optional[date]:
     if isinstance(value, datetime):
         return value.date()
 
-    # Try ISO format first
+    return _parse_date_string(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_string(value: str) -> date:
+    """
+    Parse a date string; memoized since ingest batches repeat dates.
+
+    date objects are immutable, so sharing cached instances is safe.
+    Failed parses raise and are not cached.
+    """
+    # Fast path for canonical YYYY-MM-DD (C-level parser)
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+
+    # Try ISO format (also accepts non-zero-padded month/day)
     try:
         return datetime.strptime(value, "%Y-%m-%d").date()
     except ValueError:
@@ -167,10 +229,7 @@ def validate_k_number_format(value: Optional[str]) -> Optional[str]:
 
     normalized = value.upper().strip()
 
-    # Pattern: K, BK, or DEN followed by 6-7 digits
-    pattern = r"^(K|BK|DEN)\d{6,7}$"
-
-    if not re.match(pattern, normalized):
+    if not _K_NUMBER_PATTERN.match(normalized):
         raise ValueError(
             f"Invalid 510(k) number format '{value}'. "
             "Expected K######, BK######, or DEN###### (6-7 digits)"
@@ -199,9 +258,7 @@ def validate_pma_number_format(value: Optional[str]) -> Optional[str]:
 
     normalized = value.upper().strip()
 
-    pattern = r"^P\d{6}$"
-
-    if not re.match(pattern, normalized):
+    if not _PMA_NUMBER_PATTERN.match(normalized):
         raise ValueError(
             f"Invalid PMA number format '{value}'. Expected P###### (6 digits)"
         )
@@ -229,9 +286,25 @@ def validate_product_code(value: Optional[str]) -> Optional[str]:
 
     normalized = value.upper().strip()
 
-    if not re.match(r"^[A-Z]{3}$", normalized):
+    # Equivalent to ^[A-Z]{3}$ without a regex engine call
+    if not (
+        len(normalized) == 3
+        and normalized.isascii()
+        and normalized.isalpha()
+        and normalized.isupper()
+    ):
         raise ValueError(
             f"Invalid product code format '{value}'. Expected 3 uppercase letters"
         )
 
     return normalized
+
+
+# Reusable annotated type for ISO 3166-1 alpha-2 country code fields.
+# Applying the check at the type level lets every schema share one
+# validator definition instead of each declaring its own field_validator.
+CountryCode = Annotated[
+    Optional[str],
+    Field(max_length=2),
+    AfterValidator(validate_country_code),
+]
@@ -28,109 +28,223 @@ This module provides Pydantic models for:
 - kb_manufacturer_cards: Company profiles and portfolios
 - kb_use_cases: Clinical use cases with applicable products
 
+AnyKBDocument / validate_document() validate a document of any of these
+types, dispatching on metadata_content.document_type.
+
+Exports are resolved lazily (PEP 562): importing this package does not
+import the per-collection schema modules until one of their names is
+first accessed.
+
 Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
-# Base schemas
-from ashmatics_datamodels.documents.base import (
-    CitationReference,
-    ContentBase,
-    ContentType,
-    DocumentSummaryBase,
-    DocumentType,
-    FigureReference,
-    MetadataContentBase,
-    MetadataObjectBase,
-    MongoDocumentBase,
-    SectionBase,
-    TableReference,
-)
-
-# Evidence documents
-from ashmatics_datamodels.documents.evidence import (
-    EvidenceContent,
-    EvidenceDocument,
-    EvidenceDocumentCreate,
-    EvidenceMetadataContent,
-    EvidenceSummary,
-)
-
-# Regulatory documents
-from ashmatics_datamodels.documents.regulatory import (
-    # Phase 2E enums
-    MetricType,
-    StudyType,
-    # Phase 2E models
-    PerformanceMetric,
-    PerformanceTestResults,
-    PredicateDeviceInfo,
-    RegulatoryContent,
-    RegulatoryDocument,
-    RegulatoryDocumentCreate,
-    RegulatoryMetadataContent,
-    RegulatorySummary,
-    StructuredIndication,
-    TestDataset,
-    TrainingDataCharacteristics,
-    ValidationStudy,
-    # Phase 2D models
-    DatasetCharacteristics,
-    PatientDemographics,
-)
-
-# AI Model cards
-from ashmatics_datamodels.documents.models import (
-    DataSplits,
-    ExternalResources,
-    InputSpecs,
-    ModelCardContent,
-    ModelCardDocument,
-    ModelCardDocumentCreate,
-    ModelCardMetadataContent,
-    ModelCardSummary,
-    OutputSpecs,
-    PerformanceMetrics,
-)
-
-# Product cards
-from ashmatics_datamodels.documents.products import (
-    EvidenceRef,
-    FDAClearanceRef,
-    IntegratedModelRef,
-    ProductCardContent,
-    ProductCardDocument,
-    ProductCardDocumentCreate,
-    ProductCardMetadataContent,
-    ProductCardSummary,
-    SystemRequirements,
-)
-
-# Manufacturer cards
-from ashmatics_datamodels.documents.manufacturers import (
-    ClearanceRef,
-    ManufacturerCardContent,
-    ManufacturerCardDocument,
-    ManufacturerCardDocumentCreate,
-    ManufacturerCardMetadataContent,
-    ManufacturerCardSummary,
-    ProductRef,
-)
-
-# Use cases
-from ashmatics_datamodels.documents.use_cases import (
-    ApplicableProductRef,
-    SupportingEvidenceRef,
-    UseCaseContent,
-    UseCaseDocument,
-    UseCaseDocumentCreate,
-    UseCaseMetadataContent,
-    UseCaseSummary,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Base schemas
+    from ashmatics_datamodels.documents.base import (
+        CitationReference,
+        ContentBase,
+        ContentType,
+        ContentTypeLiteral,
+        DocumentSummaryBase,
+        DocumentType,
+        DocumentTypeLiteral,
+        FigureReference,
+        MetadataContentBase,
+        MetadataObjectBase,
+        MongoDocumentBase,
+        SectionBase,
+        TableReference,
+    )
+
+    # Evidence documents
+    from ashmatics_datamodels.documents.evidence import (
+        EvidenceContent,
+        EvidenceDocument,
+        EvidenceDocumentCreate,
+        EvidenceMetadataContent,
+        EvidenceSummary,
+    )
+
+    # Regulatory documents
+    from ashmatics_datamodels.documents.regulatory import (
+        # Phase 2E enums
+        MetricType,
+        MetricTypeLiteral,
+        StudyType,
+        StudyTypeLiteral,
+        # Phase 2E models
+        PerformanceMetric,
+        PerformanceTestResults,
+        PredicateDeviceInfo,
+        RegulatoryContent,
+        RegulatoryDocument,
+        RegulatoryDocumentCreate,
+        RegulatoryMetadataContent,
+        RegulatorySummary,
+        StructuredIndication,
+        TestDataset,
+        TrainingDataCharacteristics,
+        ValidationStudy,
+        # Phase 2D models
+        DatasetCharacteristics,
+        PatientDemographics,
+    )
+
+    # AI Model cards
+    from ashmatics_datamodels.documents.models import (
+        DataSplits,
+        ExternalResources,
+        InputSpecs,
+        ModelCardContent,
+        ModelCardDocument,
+        ModelCardDocumentCreate,
+        ModelCardMetadataContent,
+        ModelCardSummary,
+        OutputSpecs,
+        PerformanceMetrics,
+    )
+
+    # Product cards
+    from ashmatics_datamodels.documents.products import (
+        EvidenceRef,
+        FDAClearanceRef,
+        IntegratedModelRef,
+        ProductCardContent,
+        ProductCardDocument,
+        ProductCardDocumentCreate,
+        ProductCardMetadataContent,
+        ProductCardSummary,
+        SystemRequirements,
+    )
+
+    # Manufacturer cards
+    from ashmatics_datamodels.documents.manufacturers import (
+        ClearanceRef,
+        ManufacturerCardContent,
+        ManufacturerCardDocument,
+        ManufacturerCardDocumentCreate,
+        ManufacturerCardMetadataContent,
+        ManufacturerCardSummary,
+        ProductRef,
+    )
+
+    # Use cases
+    from ashmatics_datamodels.documents.use_cases import (
+        ApplicableProductRef,
+        SupportingEvidenceRef,
+        UseCaseContent,
+        UseCaseDocument,
+        UseCaseDocumentCreate,
+        UseCaseMetadataContent,
+        UseCaseSummary,
+    )
+
+    # Polymorphic validation
+    from ashmatics_datamodels.documents.union import AnyKBDocument, validate_document
+
+# Submodule -> exported names, resolved on first attribute access
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "ashmatics_datamodels.documents.base": (
+        "CitationReference",
+        "ContentBase",
+        "ContentType",
+        "ContentTypeLiteral",
+        "DocumentSummaryBase",
+        "DocumentType",
+        "DocumentTypeLiteral",
+        "FigureReference",
+        "MetadataContentBase",
+        "MetadataObjectBase",
+        "MongoDocumentBase",
+        "SectionBase",
+        "TableReference",
+    ),
+    "ashmatics_datamodels.documents.evidence": (
+        "EvidenceContent",
+        "EvidenceDocument",
+        "EvidenceDocumentCreate",
+        "EvidenceMetadataContent",
+        "EvidenceSummary",
+    ),
+    "ashmatics_datamodels.documents.regulatory": (
+        "DatasetCharacteristics",
+        "MetricType",
+        "MetricTypeLiteral",
+        "PatientDemographics",
+        "PerformanceMetric",
+        "PerformanceTestResults",
+        "PredicateDeviceInfo",
+        "RegulatoryContent",
+        "RegulatoryDocument",
+        "RegulatoryDocumentCreate",
+        "RegulatoryMetadataContent",
+        "RegulatorySummary",
+        "StructuredIndication",
+        "StudyType",
+        "StudyTypeLiteral",
+        "TestDataset",
+        "TrainingDataCharacteristics",
+        "ValidationStudy",
+    ),
+    "ashmatics_datamodels.documents.models": (
+        "DataSplits",
+        "ExternalResources",
+        "InputSpecs",
+        "ModelCardContent",
+        "ModelCardDocument",
+        "ModelCardDocumentCreate",
+        "ModelCardMetadataContent",
+        "ModelCardSummary",
+        "OutputSpecs",
+        "PerformanceMetrics",
+    ),
+    "ashmatics_datamodels.documents.products": (
+        "EvidenceRef",
+        "FDAClearanceRef",
+        "IntegratedModelRef",
+        "ProductCardContent",
+        "ProductCardDocument",
+        "ProductCardDocumentCreate",
+        "ProductCardMetadataContent",
+        "ProductCardSummary",
+        "SystemRequirements",
+    ),
+    "ashmatics_datamodels.documents.manufacturers": (
+        "ClearanceRef",
+        "ManufacturerCardContent",
+        "ManufacturerCardDocument",
+        "ManufacturerCardDocumentCreate",
+        "ManufacturerCardMetadataContent",
+        "ManufacturerCardSummary",
+        "ProductRef",
+    ),
+    "ashmatics_datamodels.documents.use_cases": (
+        "ApplicableProductRef",
+        "SupportingEvidenceRef",
+        "UseCaseContent",
+        "UseCaseDocument",
+        "UseCaseDocumentCreate",
+        "UseCaseMetadataContent",
+        "UseCaseSummary",
+    ),
+    "ashmatics_datamodels.documents.union": (
+        "AnyKBDocument",
+        "validate_document",
+    ),
+}
+_NAME_TO_MODULE = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
 
 __all__ = [
     # Enums
     "DocumentType",
     "ContentType",
+    "DocumentTypeLiteral",
+    "ContentTypeLiteral",
     # Base schemas
     "MetadataObjectBase",
     "MetadataContentBase",
@@ -159,6 +273,8 @@ __all__ = [
     # Phase 2E Performance Data Models
     "StudyType",
     "MetricType",
+    "StudyTypeLiteral",
+    "MetricTypeLiteral",
     "PerformanceMetric",
     "TestDataset",
     "ValidationStudy",
@@ -203,4 +319,20 @@ __all__ = [
     "UseCaseSummary",
     "ApplicableProductRef",
     "SupportingEvidenceRef",
+    # Polymorphic validation
+    "AnyKBDocument",
+    "validate_document",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _NAME_TO_MODULE.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -23,15 +23,31 @@ All kb_* MongoDB collections follow this standardized pattern:
 Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
-
-from pydantic import Field
+from typing import Any, Literal, Optional
+
+from pydantic import (
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    ModelWrapValidatorHandler,
+    TypeAdapter,
+    model_validator,
+    with_config,
+)
+from pydantic_core import CoreSchema
+from typing_extensions import TypedDict
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 
 
+def _utcnow() -> datetime:
+    """Current time as a timezone-aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
 # =============================================================================
 # Document Type Enumerations
 # =============================================================================
@@ -48,6 +64,19 @@ class DocumentType(str, Enum):
     USE_CASE = "kb_use_case"
 
 
+# Literal alias of DocumentType used as the field type on document schemas;
+# pydantic-core checks a Literal with one set lookup instead of resolving
+# an enum member. DocumentType members are still accepted as input.
+DocumentTypeLiteral = Literal[
+    "kb_evidence_doc",
+    "kb_aimodel_card",
+    "kb_regulatory_doc",
+    "kb_product_card",
+    "kb_manufacturer_card",
+    "kb_use_case",
+]
+
+
 class ContentType(str, Enum):
     """Content type classifications within document types."""
 
@@ -72,6 +101,23 @@ class ContentType(str, Enum):
     CLINICAL_USE_CASE = "clinical_use_case"
 
 
+# Literal alias of ContentType, used the same way as DocumentTypeLiteral
+ContentTypeLiteral = Literal[
+    "peer_reviewed_paper",
+    "preprint",
+    "clinical_trial",
+    "systematic_review",
+    "meta_analysis",
+    "510k_summary",
+    "pma_summary",
+    "de_novo_summary",
+    "model_card_v1",
+    "product_profile",
+    "company_profile",
+    "clinical_use_case",
+]
+
+
 # =============================================================================
 # Tier 1: Metadata Object (Artifact Metadata)
 # =============================================================================
@@ -87,11 +133,11 @@ class MetadataObjectBase(AshMaticsBaseModel):
     """
 
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         description="When the document was first created",
     )
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utcnow,
         description="When the document was last updated",
     )
     created_by: str = Field(
@@ -144,6 +190,31 @@ class MetadataObjectBase(AshMaticsBaseModel):
         description="Any errors encountered during processing",
     )
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def _share_default_timestamps(
+        cls, data: Any, handler: ModelWrapValidatorHandler["MetadataObjectBase"]
+    ) -> "MetadataObjectBase":
+        """
+        Fill both timestamps from one clock read when neither is supplied.
+
+        A new document then gets identical created_at/updated_at values.
+        If only created_at is given (e.g., a backfilled document),
+        updated_at still defaults to the current time. The filled values
+        stay out of model_fields_set, like ordinary field defaults, so
+        exclude_unset dumps never overwrite stored timestamps.
+        """
+        if not (
+            isinstance(data, dict)
+            and "created_at" not in data
+            and "updated_at" not in data
+        ):
+            return handler(data)
+        now = _utcnow()
+        instance = handler({**data, "created_at": now, "updated_at": now})
+        instance.__pydantic_fields_set__.difference_update(("created_at", "updated_at"))
+        return instance
+
 
 # =============================================================================
 # Tier 2: Metadata Content (Content Classification)
@@ -158,11 +229,11 @@ class MetadataContentBase(AshMaticsBaseModel):
     filtering, and categorization. Extended by type-specific schemas.
     """
 
-    document_type: DocumentType = Field(
+    document_type: DocumentTypeLiteral = Field(
         ...,
         description="Type of document (maps to MongoDB collection)",
     )
-    content_type: ContentType = Field(
+    content_type: ContentTypeLiteral = Field(
         ...,
         description="Specific content type within the document type",
     )
@@ -225,6 +296,81 @@ class SectionBase(AshMaticsBaseModel):
     )
 
 
+SectionTemplate = Mapping[str, tuple[type[SectionBase], str, int]]
+
+
+def _sections_typeddict(template: SectionTemplate) -> Any:
+    """TypedDict of the template's section classes, other keys as SectionBase."""
+    section_types = {
+        section_id: section_type
+        for section_id, (section_type, _, _) in template.items()
+    }
+    sections_type = TypedDict(  # type: ignore[misc]
+        "Sections", section_types, total=False, extra_items=SectionBase
+    )
+    # extra_items already admits custom sections; this only stops pydantic
+    # warning that the TypedDict ignores an inherited extra="forbid"
+    return with_config(ConfigDict(extra="allow"))(sections_type)
+
+
+class TypedSections:
+    """
+    Annotated marker that validates standard sections as their own classes.
+
+    Use on a content schema's sections field together with the template
+    passed to section_defaults():
+
+        sections: Annotated[dict[str, SectionBase], TypedSections(TEMPLATE)]
+
+    Each standard key validates and serializes as its concrete section
+    class, so subclass fields survive dumps and reloads; any other key is
+    a plain SectionBase. The static type stays dict[str, SectionBase].
+    """
+
+    def __init__(self, template: SectionTemplate) -> None:
+        self.template = template
+
+    def __get_pydantic_core_schema__(
+        self, source_type: Any, handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return handler.generate_schema(_sections_typeddict(self.template))
+
+
+def section_defaults(
+    template: SectionTemplate,
+) -> Callable[[], dict[str, SectionBase]]:
+    """
+    Create a default_factory for a content schema's standard sections.
+
+    The sections are validated in a single pydantic-core call through a
+    TypedDict of their concrete section types. That is cheaper than
+    constructing each section model one by one, and subclass-specific
+    fields are kept. The validator is built on the first call, not at
+    import. Every call returns new instances, so documents never share
+    mutable section state.
+
+    Args:
+        template: (section class, title, order) keyed by section_id
+            (e.g., {"1_introduction": (SectionBase, "Introduction", 1)})
+
+    Returns:
+        Zero-argument callable returning sections keyed by section_id
+    """
+    raw = {
+        section_id: {"title": title, "order": order}
+        for section_id, (_, title, order) in template.items()
+    }
+    adapter: Optional[TypeAdapter[dict[str, SectionBase]]] = None
+
+    def build() -> dict[str, SectionBase]:
+        nonlocal adapter
+        if adapter is None:
+            adapter = TypeAdapter(_sections_typeddict(template))
+        return adapter.validate_python(raw)
+
+    return build
+
+
 class FigureReference(AshMaticsBaseModel):
     """Reference to a figure within a document."""
 
@@ -370,11 +516,11 @@ class DocumentSummaryBase(AshMaticsBaseModel):
         alias="_id",
         description="MongoDB document ID",
     )
-    document_type: DocumentType = Field(
+    document_type: DocumentTypeLiteral = Field(
         ...,
         description="Type of document",
     )
-    content_type: ContentType = Field(
+    content_type: ContentTypeLiteral = Field(
         ...,
         description="Content type classification",
     )
@@ -404,13 +550,15 @@ class DocumentSummaryBase(AshMaticsBaseModel):
     @classmethod
     def from_document(cls, doc: MongoDocumentBase) -> "DocumentSummaryBase":
         """Create summary from full document."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
         )
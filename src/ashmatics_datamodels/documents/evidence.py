@@ -29,15 +29,16 @@ from pydantic import Field
 from ashmatics_datamodels.documents.base import (
     CitationReference,
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     FigureReference,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
     TableReference,
+    section_defaults,
 )
 
 
@@ -54,12 +55,12 @@ class EvidenceMetadataContent(MetadataContentBase):
     authors, journal, DOI, and anatomical focus.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.EVIDENCE_DOC,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_evidence_doc",
         description="Always 'kb_evidence_doc' for evidence documents",
     )
-    content_type: ContentType = Field(
-        default=ContentType.PEER_REVIEWED_PAPER,
+    content_type: ContentTypeLiteral = Field(
+        default="peer_reviewed_paper",
         description="Type of evidence (peer_reviewed_paper, preprint, etc.)",
     )
 
@@ -110,13 +111,15 @@ class EvidenceContent(ContentBase):
     """
 
     sections: dict[str, SectionBase] = Field(
-        default_factory=lambda: {
-            "1_introduction": SectionBase(title="Introduction", order=1),
-            "2_methods": SectionBase(title="Methods", order=2),
-            "3_results": SectionBase(title="Results", order=3),
-            "4_discussion": SectionBase(title="Discussion", order=4),
-            "5_conclusion": SectionBase(title="Conclusion", order=5),
-        },
+        default_factory=section_defaults(
+            {
+                "1_introduction": (SectionBase, "Introduction", 1),
+                "2_methods": (SectionBase, "Methods", 2),
+                "3_results": (SectionBase, "Results", 3),
+                "4_discussion": (SectionBase, "Discussion", 4),
+                "5_conclusion": (SectionBase, "Conclusion", 5),
+            }
+        ),
         description="Standard academic paper sections",
     )
     figures: list[FigureReference] = Field(
@@ -184,8 +187,8 @@ class EvidenceSummary(DocumentSummaryBase):
     Flattens key publication metadata for search results.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.EVIDENCE_DOC,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_evidence_doc",
         description="Always kb_evidence_doc",
     )
 
@@ -218,19 +221,21 @@ class EvidenceSummary(DocumentSummaryBase):
     @classmethod
     def from_document(cls, doc: EvidenceDocument) -> "EvidenceSummary":
         """Create summary from full evidence document."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            authors=doc.metadata_content.authors,
-            journal=doc.metadata_content.journal,
-            publication_date=doc.metadata_content.publication_date,
-            doi=doc.metadata_content.doi,
-            abstract=doc.metadata_content.abstract,
-            anatomical_region=doc.metadata_content.anatomical_region,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            authors=mc.authors,
+            journal=mc.journal,
+            publication_date=mc.publication_date,
+            doi=mc.doi,
+            abstract=mc.abstract,
+            anatomical_region=mc.anatomical_region,
         )
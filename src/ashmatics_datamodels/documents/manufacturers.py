@@ -22,20 +22,23 @@ Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
 from datetime import date
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import Field
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 from ashmatics_datamodels.documents.base import (
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
+    SectionTemplate,
+    TypedSections,
+    section_defaults,
 )
 
 
@@ -154,12 +157,12 @@ class ManufacturerCardMetadataContent(MetadataContentBase):
     Metadata content specific to manufacturer cards.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.MANUFACTURER_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_manufacturer_card",
         description="Always 'kb_manufacturer_card'",
     )
-    content_type: ContentType = Field(
-        default=ContentType.COMPANY_PROFILE,
+    content_type: ContentTypeLiteral = Field(
+        default="company_profile",
         description="Company profile type",
     )
 
@@ -187,26 +190,27 @@ class ManufacturerCardMetadataContent(MetadataContentBase):
 # =============================================================================
 
 
+_MANUFACTURER_CARD_SECTIONS: SectionTemplate = {
+    "company_overview": (CompanyOverviewSection, "Company Overview", 1),
+    "product_portfolio": (ProductPortfolioSection, "Product Portfolio", 2),
+    "regulatory_history": (RegulatoryHistorySection, "Regulatory History", 3),
+    "research_partnerships": (
+        ResearchPartnershipsSection,
+        "Research & Partnerships",
+        4,
+    ),
+}
+
+
 class ManufacturerCardContent(ContentBase):
     """
     Content structure for manufacturer cards.
     """
 
-    sections: dict[str, SectionBase] = Field(
-        default_factory=lambda: {
-            "company_overview": CompanyOverviewSection(
-                title="Company Overview", order=1
-            ),
-            "product_portfolio": ProductPortfolioSection(
-                title="Product Portfolio", order=2
-            ),
-            "regulatory_history": RegulatoryHistorySection(
-                title="Regulatory History", order=3
-            ),
-            "research_partnerships": ResearchPartnershipsSection(
-                title="Research & Partnerships", order=4
-            ),
-        },
+    sections: Annotated[
+        dict[str, SectionBase], TypedSections(_MANUFACTURER_CARD_SECTIONS)
+    ] = Field(
+        default_factory=section_defaults(_MANUFACTURER_CARD_SECTIONS),
         description="Manufacturer card sections",
     )
 
@@ -260,8 +264,8 @@ class ManufacturerCardSummary(DocumentSummaryBase):
     Summary view for manufacturer cards in listings.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.MANUFACTURER_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_manufacturer_card",
         description="Always kb_manufacturer_card",
     )
 
@@ -284,16 +288,18 @@ class ManufacturerCardSummary(DocumentSummaryBase):
         cls, doc: ManufacturerCardDocument
     ) -> "ManufacturerCardSummary":
         """Create summary from full manufacturer card."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            company_name=doc.metadata_content.company_name,
-            headquarters=doc.metadata_content.headquarters,
-            founded=doc.metadata_content.founded,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            company_name=mc.company_name,
+            headquarters=mc.headquarters,
+            founded=mc.founded,
         )
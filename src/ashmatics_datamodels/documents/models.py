@@ -22,20 +22,23 @@ Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
 from datetime import date
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from pydantic import Field
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 from ashmatics_datamodels.documents.base import (
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
+    SectionTemplate,
+    TypedSections,
+    section_defaults,
 )
 
 
@@ -280,12 +283,12 @@ class ModelCardMetadataContent(MetadataContentBase):
     Metadata content specific to AI model cards.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.AIMODEL_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_aimodel_card",
         description="Always 'kb_aimodel_card'",
     )
-    content_type: ContentType = Field(
-        default=ContentType.MODEL_CARD_V1,
+    content_type: ContentTypeLiteral = Field(
+        default="model_card_v1",
         description="Model card format version",
     )
 
@@ -319,20 +322,25 @@ class ModelCardMetadataContent(MetadataContentBase):
 # =============================================================================
 
 
+_MODEL_CARD_SECTIONS: SectionTemplate = {
+    "model_overview": (ModelOverviewSection, "Model Overview", 1),
+    "training_data": (TrainingDataSection, "Training Data", 2),
+    "performance_metrics": (PerformanceSection, "Performance", 3),
+    "limitations": (LimitationsSection, "Limitations & Biases", 4),
+    "intended_use": (IntendedUseSection, "Intended Use", 5),
+}
+
+
 class ModelCardContent(ContentBase):
     """
     Content structure for AI model cards.
     """
 
-    sections: dict[str, SectionBase] = Field(
-        default_factory=lambda: {
-            "model_overview": ModelOverviewSection(title="Model Overview", order=1),
-            "training_data": TrainingDataSection(title="Training Data", order=2),
-            "performance_metrics": PerformanceSection(title="Performance", order=3),
-            "limitations": LimitationsSection(title="Limitations & Biases", order=4),
-            "intended_use": IntendedUseSection(title="Intended Use", order=5),
-        },
-        description="Model card sections",
+    sections: Annotated[dict[str, SectionBase], TypedSections(_MODEL_CARD_SECTIONS)] = (
+        Field(
+            default_factory=section_defaults(_MODEL_CARD_SECTIONS),
+            description="Model card sections",
+        )
     )
     external_resources: Optional[ExternalResources] = Field(
         None,
@@ -389,8 +397,8 @@ class ModelCardSummary(DocumentSummaryBase):
     Summary view for model cards in listings.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.AIMODEL_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_aimodel_card",
         description="Always kb_aimodel_card",
     )
 
@@ -415,17 +423,19 @@ class ModelCardSummary(DocumentSummaryBase):
     @classmethod
     def from_document(cls, doc: ModelCardDocument) -> "ModelCardSummary":
         """Create summary from full model card."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            model_name=doc.metadata_content.model_name,
-            model_version=doc.metadata_content.model_version,
-            developer=doc.metadata_content.developer,
-            anatomical_region=doc.metadata_content.anatomical_region,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            model_name=mc.model_name,
+            model_version=mc.model_version,
+            developer=mc.developer,
+            anatomical_region=mc.anatomical_region,
         )
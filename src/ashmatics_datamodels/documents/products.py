@@ -22,20 +22,23 @@ Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
 from datetime import date
-from typing import Any, Optional
+from typing import Annotated, Any, Optional
 
 from pydantic import Field
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 from ashmatics_datamodels.documents.base import (
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
+    SectionTemplate,
+    TypedSections,
+    section_defaults,
 )
 
 
@@ -198,12 +201,12 @@ class ProductCardMetadataContent(MetadataContentBase):
     Metadata content specific to product cards.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.PRODUCT_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_product_card",
         description="Always 'kb_product_card'",
     )
-    content_type: ContentType = Field(
-        default=ContentType.PRODUCT_PROFILE,
+    content_type: ContentTypeLiteral = Field(
+        default="product_profile",
         description="Product profile type",
     )
 
@@ -231,27 +234,24 @@ class ProductCardMetadataContent(MetadataContentBase):
 # =============================================================================
 
 
+_PRODUCT_CARD_SECTIONS: SectionTemplate = {
+    "product_overview": (ProductOverviewSection, "Product Overview", 1),
+    "regulatory_status": (RegulatoryStatusSection, "Regulatory Status", 2),
+    "ai_models": (AIModelsSection, "AI Models", 3),
+    "clinical_evidence": (ClinicalEvidenceSection, "Clinical Evidence", 4),
+    "technical_specifications": (TechnicalSpecsSection, "Technical Specifications", 5),
+}
+
+
 class ProductCardContent(ContentBase):
     """
     Content structure for product cards.
     """
 
-    sections: dict[str, SectionBase] = Field(
-        default_factory=lambda: {
-            "product_overview": ProductOverviewSection(
-                title="Product Overview", order=1
-            ),
-            "regulatory_status": RegulatoryStatusSection(
-                title="Regulatory Status", order=2
-            ),
-            "ai_models": AIModelsSection(title="AI Models", order=3),
-            "clinical_evidence": ClinicalEvidenceSection(
-                title="Clinical Evidence", order=4
-            ),
-            "technical_specifications": TechnicalSpecsSection(
-                title="Technical Specifications", order=5
-            ),
-        },
+    sections: Annotated[
+        dict[str, SectionBase], TypedSections(_PRODUCT_CARD_SECTIONS)
+    ] = Field(
+        default_factory=section_defaults(_PRODUCT_CARD_SECTIONS),
         description="Product card sections",
     )
 
@@ -305,8 +305,8 @@ class ProductCardSummary(DocumentSummaryBase):
     Summary view for product cards in listings.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.PRODUCT_CARD,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_product_card",
         description="Always kb_product_card",
     )
 
@@ -331,17 +331,19 @@ class ProductCardSummary(DocumentSummaryBase):
     @classmethod
     def from_document(cls, doc: ProductCardDocument) -> "ProductCardSummary":
         """Create summary from full product card."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            product_name=doc.metadata_content.product_name,
-            manufacturer=doc.metadata_content.manufacturer,
-            fda_status=doc.metadata_content.fda_status,
-            k_numbers=doc.metadata_content.k_numbers,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            product_name=mc.product_name,
+            manufacturer=mc.manufacturer,
+            fda_status=mc.fda_status,
+            k_numbers=mc.k_numbers,
         )
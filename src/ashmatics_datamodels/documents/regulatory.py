@@ -32,20 +32,21 @@ Vocabulary: https://open.fda.gov/device/510k/
 
 from datetime import date
 from enum import Enum
-from typing import Annotated, Any, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from pydantic import Discriminator, Field, Tag
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 from ashmatics_datamodels.documents.base import (
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
+    section_defaults,
 )
 
 
@@ -71,6 +72,20 @@ class StudyType(str, Enum):
     UNKNOWN = "unknown"  # Cannot determine study type
 
 
+# Literal alias of StudyType used as the field type on ValidationStudy,
+# following DocumentTypeLiteral. StudyType members are still accepted.
+StudyTypeLiteral = Literal[
+    "standalone",
+    "clinical_validation",
+    "reader_study",
+    "pivotal_study",
+    "pilot_study",
+    "retrospective",
+    "prospective",
+    "unknown",
+]
+
+
 class MetricType(str, Enum):
     """
     Type of performance metric (REQ-3.1).
@@ -96,6 +111,27 @@ class MetricType(str, Enum):
     OTHER = "other"  # Other metric types not in standard list
 
 
+# Literal alias of MetricType, used the same way as StudyTypeLiteral
+MetricTypeLiteral = Literal[
+    "sensitivity",
+    "specificity",
+    "auc",
+    "dice",
+    "accuracy",
+    "ppv",
+    "npv",
+    "f1_score",
+    "precision",
+    "recall",
+    "hausdorff_distance",
+    "time_to_detection",
+    "time_to_notification",
+    "detection_rate",
+    "false_positive_rate",
+    "other",
+]
+
+
 # =============================================================================
 # Regulatory-Specific Nested Schemas
 # =============================================================================
@@ -248,7 +284,7 @@ class PerformanceMetric(AshMaticsBaseModel):
         ...,
         description="Metric name as appears in document (e.g., 'sensitivity', 'DICE', 'AUC')",
     )
-    metric_type: Optional[MetricType] = Field(
+    metric_type: Optional[MetricTypeLiteral] = Field(
         None,
         description="Standardized metric type for querying across devices",
     )
@@ -411,7 +447,7 @@ class ValidationStudy(AshMaticsBaseModel):
         None,
         description="Study name (e.g., 'Pivotal Study', 'Pilot Study', 'Reader Study')",
     )
-    study_type: StudyType = Field(
+    study_type: StudyTypeLiteral = Field(
         ...,
         description="Type of validation study",
     )
@@ -700,12 +736,12 @@ class RegulatoryMetadataContent(MetadataContentBase):
     with OpenFDA vocabulary.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.REGULATORY_DOC,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_regulatory_doc",
         description="Always 'kb_regulatory_doc' for regulatory documents",
     )
-    content_type: ContentType = Field(
-        default=ContentType.SUMMARY_510K,
+    content_type: ContentTypeLiteral = Field(
+        default="510k_summary",
         description="Type of regulatory document",
     )
 
@@ -844,26 +880,32 @@ class RegulatoryContent(ContentBase):
     """
 
     sections: dict[str, RegulatorySection] = Field(  # type: ignore[assignment]
-        default_factory=lambda: {
-            "0_sponsor": SponsorSection(
-                title="Sponsor Information", order=0
-            ),
-            "1_device_description": DeviceDescriptionSection(
-                title="Device Description", order=1
-            ),
-            "2_indications_for_use": IndicationsSection(
-                title="Indications for Use", order=2
-            ),
-            "3_predicate_devices": PredicatesSection(
-                title="Predicate Devices", order=3
-            ),
-            "4_performance_testing": PerformanceTestingSection(
-                title="Performance Testing", order=4
-            ),
-            "5_substantial_equivalence": SubstantialEquivalenceSection(
-                title="Substantial Equivalence", order=5
-            ),
-        },
+        default_factory=section_defaults(
+            {
+                "0_sponsor": (SponsorSection, "Sponsor Information", 0),
+                "1_device_description": (
+                    DeviceDescriptionSection,
+                    "Device Description",
+                    1,
+                ),
+                "2_indications_for_use": (
+                    IndicationsSection,
+                    "Indications for Use",
+                    2,
+                ),
+                "3_predicate_devices": (PredicatesSection, "Predicate Devices", 3),
+                "4_performance_testing": (
+                    PerformanceTestingSection,
+                    "Performance Testing",
+                    4,
+                ),
+                "5_substantial_equivalence": (
+                    SubstantialEquivalenceSection,
+                    "Substantial Equivalence",
+                    5,
+                ),
+            }
+        ),
         description="Enriched/normalized 510(k) summary sections (Ashmatics value-add)",
     )
 
@@ -924,8 +966,8 @@ class RegulatorySummary(DocumentSummaryBase):
     Flattens key FDA metadata for search results.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.REGULATORY_DOC,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_regulatory_doc",
         description="Always kb_regulatory_doc",
     )
 
@@ -959,23 +1001,56 @@ class RegulatorySummary(DocumentSummaryBase):
         description="Product code",
     )
 
+    @classmethod
+    def mongo_projection(cls) -> dict[str, Any]:
+        """
+        MongoDB $project stage that flattens a kb_regulatory_docs record
+        into summary fields.
+
+        Rows from an aggregation ending in this stage validate directly
+        with RegulatorySummary.model_validate(row), so listing endpoints
+        skip building the full RegulatoryDocument and its content sections.
+
+        Returns:
+            New $project specification (safe for callers to extend)
+        """
+        return {
+            "_id": {"$toString": "$_id"},
+            "document_type": "$metadata_content.document_type",
+            "content_type": "$metadata_content.content_type",
+            "title": "$metadata_content.title",
+            "clinical_domain": "$metadata_content.clinical_domain",
+            "tags": "$metadata_content.tags",
+            "created_at": "$metadata_object.created_at",
+            "updated_at": "$metadata_object.updated_at",
+            "k_number": "$metadata_content.k_number",
+            "pma_number": "$metadata_content.pma_number",
+            "clearance_date": "$metadata_content.clearance_date",
+            "applicant": "$metadata_content.applicant",
+            "device_name": "$metadata_content.device_name",
+            "device_class": "$metadata_content.device_class",
+            "product_code": "$metadata_content.product_code",
+        }
+
     @classmethod
     def from_document(cls, doc: RegulatoryDocument) -> "RegulatorySummary":
         """Create summary from full regulatory document."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            k_number=doc.metadata_content.k_number,
-            pma_number=doc.metadata_content.pma_number,
-            clearance_date=doc.metadata_content.clearance_date,
-            applicant=doc.metadata_content.applicant,
-            device_name=doc.metadata_content.device_name,
-            device_class=doc.metadata_content.device_class,
-            product_code=doc.metadata_content.product_code,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            k_number=mc.k_number,
+            pma_number=mc.pma_number,
+            clearance_date=mc.clearance_date,
+            applicant=mc.applicant,
+            device_name=mc.device_name,
+            device_class=mc.device_class,
+            product_code=mc.product_code,
         )
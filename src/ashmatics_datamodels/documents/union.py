@@ -0,0 +1,91 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Polymorphic validation across all kb_* document types.
+
+AnyKBDocument dispatches on metadata_content.document_type, so code that
+reads documents from mixed sources validates once against the right
+subclass instead of trying each document model in turn.
+"""
+
+from functools import lru_cache
+from typing import Annotated, Any, Optional, Union
+
+from pydantic import Discriminator, Tag, TypeAdapter
+
+from ashmatics_datamodels.documents.evidence import EvidenceDocument
+from ashmatics_datamodels.documents.manufacturers import ManufacturerCardDocument
+from ashmatics_datamodels.documents.models import ModelCardDocument
+from ashmatics_datamodels.documents.products import ProductCardDocument
+from ashmatics_datamodels.documents.regulatory import RegulatoryDocument
+from ashmatics_datamodels.documents.use_cases import UseCaseDocument
+
+
+def _get_document_type(v: Any) -> Optional[str]:
+    """
+    Discriminator function for the AnyKBDocument union.
+
+    Reads metadata_content.document_type from raw dicts (MongoDB reads,
+    API payloads) or from already-built document models.
+    """
+    if isinstance(v, dict):
+        metadata_content = v.get("metadata_content")
+        if isinstance(metadata_content, dict):
+            document_type = metadata_content.get("document_type")
+        else:
+            document_type = getattr(metadata_content, "document_type", None)
+    else:
+        document_type = getattr(
+            getattr(v, "metadata_content", None), "document_type", None
+        )
+    # Enum members and plain strings both map to the raw value
+    return getattr(document_type, "value", document_type)
+
+
+# Union of all complete kb_* documents, tagged by DocumentType value
+AnyKBDocument = Annotated[
+    Union[
+        Annotated[EvidenceDocument, Tag("kb_evidence_doc")],
+        Annotated[ModelCardDocument, Tag("kb_aimodel_card")],
+        Annotated[RegulatoryDocument, Tag("kb_regulatory_doc")],
+        Annotated[ProductCardDocument, Tag("kb_product_card")],
+        Annotated[ManufacturerCardDocument, Tag("kb_manufacturer_card")],
+        Annotated[UseCaseDocument, Tag("kb_use_case")],
+    ],
+    Discriminator(_get_document_type),
+]
+
+
+@lru_cache(maxsize=1)
+def _document_adapter() -> TypeAdapter[AnyKBDocument]:
+    """Build the union validator on first use, not at import."""
+    return TypeAdapter(AnyKBDocument)
+
+
+def validate_document(data: Any) -> AnyKBDocument:
+    """
+    Validate a raw kb_* document into its concrete document model.
+
+    Args:
+        data: Document dict (e.g., a MongoDB record) or document model
+
+    Returns:
+        EvidenceDocument, RegulatoryDocument, etc. per document_type
+
+    Raises:
+        ValidationError: If document_type is missing/unknown or the
+            document fails validation for its type
+    """
+    return _document_adapter().validate_python(data)
@@ -21,20 +21,23 @@ applicable products, and supporting evidence.
 Reference: docs/Plans/DocumentDataModelSchema-Normalize-2025-11-15/
 """
 
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import Field
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel
 from ashmatics_datamodels.documents.base import (
     ContentBase,
-    ContentType,
+    ContentTypeLiteral,
     DocumentSummaryBase,
-    DocumentType,
+    DocumentTypeLiteral,
     MetadataContentBase,
     MetadataObjectBase,
     MongoDocumentBase,
     SectionBase,
+    SectionTemplate,
+    TypedSections,
+    section_defaults,
 )
 
 
@@ -190,12 +193,12 @@ class UseCaseMetadataContent(MetadataContentBase):
     Metadata content specific to use cases.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.USE_CASE,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_use_case",
         description="Always 'kb_use_case'",
     )
-    content_type: ContentType = Field(
-        default=ContentType.CLINICAL_USE_CASE,
+    content_type: ContentTypeLiteral = Field(
+        default="clinical_use_case",
         description="Clinical use case type",
     )
 
@@ -219,33 +222,30 @@ class UseCaseMetadataContent(MetadataContentBase):
 # =============================================================================
 
 
+_USE_CASE_SECTIONS: SectionTemplate = {
+    "use_case_overview": (UseCaseOverviewSection, "Use Case Overview", 1),
+    "clinical_context": (ClinicalContextSection, "Clinical Context", 2),
+    "technical_requirements": (
+        TechnicalRequirementsSection,
+        "Technical Requirements",
+        3,
+    ),
+    "applicable_products": (ApplicableProductsSection, "Applicable Products", 4),
+    "supporting_evidence": (SupportingEvidenceSection, "Clinical Evidence", 5),
+    "implementation_considerations": (ImplementationSection, "Implementation", 6),
+}
+
+
 class UseCaseContent(ContentBase):
     """
     Content structure for use cases.
     """
 
-    sections: dict[str, SectionBase] = Field(
-        default_factory=lambda: {
-            "use_case_overview": UseCaseOverviewSection(
-                title="Use Case Overview", order=1
-            ),
-            "clinical_context": ClinicalContextSection(
-                title="Clinical Context", order=2
-            ),
-            "technical_requirements": TechnicalRequirementsSection(
-                title="Technical Requirements", order=3
-            ),
-            "applicable_products": ApplicableProductsSection(
-                title="Applicable Products", order=4
-            ),
-            "supporting_evidence": SupportingEvidenceSection(
-                title="Clinical Evidence", order=5
-            ),
-            "implementation_considerations": ImplementationSection(
-                title="Implementation", order=6
-            ),
-        },
-        description="Use case sections",
+    sections: Annotated[dict[str, SectionBase], TypedSections(_USE_CASE_SECTIONS)] = (
+        Field(
+            default_factory=section_defaults(_USE_CASE_SECTIONS),
+            description="Use case sections",
+        )
     )
 
 
@@ -298,8 +298,8 @@ class UseCaseSummary(DocumentSummaryBase):
     Summary view for use cases in listings.
     """
 
-    document_type: DocumentType = Field(
-        default=DocumentType.USE_CASE,
+    document_type: DocumentTypeLiteral = Field(
+        default="kb_use_case",
         description="Always kb_use_case",
     )
 
@@ -320,16 +320,18 @@ class UseCaseSummary(DocumentSummaryBase):
     @classmethod
     def from_document(cls, doc: UseCaseDocument) -> "UseCaseSummary":
         """Create summary from full use case."""
+        mc = doc.metadata_content
+        mo = doc.metadata_object
         return cls(
             _id=doc.id or "",
-            document_type=doc.metadata_content.document_type,
-            content_type=doc.metadata_content.content_type,
-            title=doc.metadata_content.title,
-            clinical_domain=doc.metadata_content.clinical_domain,
-            tags=doc.metadata_content.tags,
-            created_at=doc.metadata_object.created_at,
-            updated_at=doc.metadata_object.updated_at,
-            clinical_specialty=doc.metadata_content.clinical_specialty,
-            anatomical_region=doc.metadata_content.anatomical_region,
-            pathology=doc.metadata_content.pathology,
+            document_type=mc.document_type,
+            content_type=mc.content_type,
+            title=mc.title,
+            clinical_domain=mc.clinical_domain,
+            tags=mc.tags,
+            created_at=mo.created_at,
+            updated_at=mo.updated_at,
+            clinical_specialty=mc.clinical_specialty,
+            anatomical_region=mc.anatomical_region,
+            pathology=mc.pathology,
         )
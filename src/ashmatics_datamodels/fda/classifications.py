@@ -28,7 +28,6 @@ Migrated from: KB src/app/schemas/product_classification_schema.py
                KB src/app/schemas/product_classification_system_schema.py
 """
 
-from datetime import datetime
 from typing import Optional
 
 from pydantic import AliasChoices, Field, computed_field, field_validator
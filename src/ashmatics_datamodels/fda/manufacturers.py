@@ -23,10 +23,10 @@ Reference: 21 CFR Part 807 (Registration and Listing)
 
 from typing import Optional
 
-from pydantic import Field, computed_field, field_validator
+from pydantic import Field, computed_field
 
 from ashmatics_datamodels.common.base import AshMaticsBaseModel, AuditedModel
-from ashmatics_datamodels.common.validators import validate_country_code
+from ashmatics_datamodels.common.validators import CountryCode
 
 
 class FDA_ManufacturerAddress(AshMaticsBaseModel):
@@ -63,18 +63,11 @@ class FDA_ManufacturerAddress(AshMaticsBaseModel):
         max_length=20,
         description="Postal code (US ZIP code or international equivalent)",
     )
-    manufacturer_country: Optional[str] = Field(
+    manufacturer_country: CountryCode = Field(
         None,
-        max_length=2,
         description="ISO 3166-1 alpha-2 country code (e.g., 'US', 'DE', 'JP')",
     )
 
-    @field_validator("manufacturer_country")
-    @classmethod
-    def validate_country(cls, v: Optional[str]) -> Optional[str]:
-        """Validate ISO country code."""
-        return validate_country_code(v)
-
 
 class FDA_ManufacturerBase(AshMaticsBaseModel):
     """
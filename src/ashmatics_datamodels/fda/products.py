@@ -23,7 +23,7 @@ Migrated from: KB src/app/schemas/product_regulatory_status_schema.py
 JIRA: ASHKBAPP-28 (Phase 2.3)
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 
 from pydantic import Field
@@ -19,7 +19,6 @@ Provides hierarchical categorization for organizing clinical AI use cases.
 Derived from ASHKBAPP-28 Phase 2.3 work.
 """
 
-from datetime import datetime
 from typing import Optional
 
 from pydantic import Field
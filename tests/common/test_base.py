@@ -0,0 +1,77 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for base model configuration."""
+
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+import pytest
+
+from ashmatics_datamodels.common import RegulatorBase, RegulatorStats, to_json
+from ashmatics_datamodels.documents import DocumentSummaryBase
+
+
+class TestAssignmentValidation:
+    """Tests for the validate_assignment switch."""
+
+    def test_enabled_by_default(self):
+        """Test that invalid assignments are rejected by default."""
+        regulator = RegulatorBase(code="FDA", name="Food and Drug Administration")
+        with pytest.raises(ValueError):
+            regulator.country_code = "XX"
+
+    def test_env_var_disables(self):
+        """Test that ASHMATICS_VALIDATE_ASSIGNMENT=0 turns it off."""
+        code = (
+            "from ashmatics_datamodels.common import AshMaticsBaseModel;"
+            "print(AshMaticsBaseModel.model_config['validate_assignment'])"
+        )
+        env = {**os.environ, "ASHMATICS_VALIDATE_ASSIGNMENT": "0"}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+
+class TestToJson:
+    """Tests for the to_json serialization helper."""
+
+    def test_matches_model_dump_json(self):
+        """Test that bytes output matches model_dump_json."""
+        stats = RegulatorStats(
+            total_regulators=3, active_regulators=2, by_region={"EU": 1}
+        )
+        assert to_json(stats) == stats.model_dump_json(by_alias=True).encode()
+
+    def test_uses_aliases(self):
+        """Test that aliased fields serialize under their alias by default."""
+        now = datetime.now(timezone.utc)
+        summary = DocumentSummaryBase(
+            _id="doc-1",
+            document_type="kb_evidence_doc",
+            content_type="preprint",
+            title="Title",
+            created_at=now,
+            updated_at=now,
+        )
+        assert json.loads(to_json(summary))["_id"] == "doc-1"
+        assert json.loads(to_json(summary, by_alias=False))["id"] == "doc-1"
@@ -0,0 +1,61 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for enumerations and their Literal aliases."""
+
+from typing import get_args
+
+import pytest
+
+from ashmatics_datamodels.common import (
+    AuthorizationStatus,
+    AuthorizationStatusLiteral,
+    ParsingStatus,
+    ParsingStatusLiteral,
+    Region,
+    RegionLiteral,
+    RegulatoryStatus,
+    RegulatoryStatusLiteral,
+    RiskCategory,
+    RiskCategoryLiteral,
+)
+from ashmatics_datamodels.documents import (
+    ContentType,
+    ContentTypeLiteral,
+    DocumentType,
+    DocumentTypeLiteral,
+    MetricType,
+    MetricTypeLiteral,
+    StudyType,
+    StudyTypeLiteral,
+)
+
+
+@pytest.mark.parametrize(
+    ("enum_cls", "literal"),
+    [
+        (AuthorizationStatus, AuthorizationStatusLiteral),
+        (RegulatoryStatus, RegulatoryStatusLiteral),
+        (RiskCategory, RiskCategoryLiteral),
+        (ParsingStatus, ParsingStatusLiteral),
+        (Region, RegionLiteral),
+        (DocumentType, DocumentTypeLiteral),
+        (ContentType, ContentTypeLiteral),
+        (StudyType, StudyTypeLiteral),
+        (MetricType, MetricTypeLiteral),
+    ],
+)
+def test_literal_matches_enum(enum_cls, literal):
+    """Test that each Literal alias lists exactly the enum's values."""
+    assert get_args(literal) == tuple(member.value for member in enum_cls)
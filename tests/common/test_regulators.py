@@ -0,0 +1,107 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for regulator and regulatory framework schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from ashmatics_datamodels.common import (
+    RegulatorCreate,
+    RegulatorResponse,
+    RegulatorStats,
+    RegulatorSummary,
+    RegulatorUpdate,
+    RegulatoryFrameworkResponse,
+)
+
+
+class TestFromRow:
+    """Tests for trusted-row response factories."""
+
+    def test_regulator_from_row(self):
+        """Test building a regulator response without validation."""
+        row = {"id": 1, "code": "FDA", "name": "Food and Drug Administration"}
+        regulator = RegulatorResponse.from_row(row)
+        assert regulator.code == "FDA"
+        assert regulator.is_active is True
+        assert regulator.framework_count == 0
+        assert regulator.model_fields_set == {"id", "code", "name"}
+
+    def test_framework_from_row(self):
+        """Test building a framework response with a nested regulator."""
+        row = {
+            "id": 10,
+            "regulator_id": 1,
+            "framework_code": "510K",
+            "framework_name": "Premarket Notification 510(k)",
+            "authorization_type": "clearance",
+            "requires_premarket_review": True,
+            "regulator": RegulatorSummary(id=1, code="FDA", name="FDA"),
+        }
+        framework = RegulatoryFrameworkResponse.from_row(row)
+        assert framework.regulator.code == "FDA"
+        assert framework.model_dump()["regulator"]["code"] == "FDA"
+
+
+class TestReadOnlyModels:
+    """Tests for frozen summary/stats schemas."""
+
+    def test_summary_is_frozen_and_hashable(self):
+        """Test that summaries reject mutation and can be cached by hash."""
+        summary = RegulatorSummary(id=1, code="FDA", name="FDA")
+        with pytest.raises(ValidationError):
+            summary.name = "Other"
+        assert hash(summary) == hash(RegulatorSummary(id=1, code="FDA", name="FDA"))
+
+    def test_stats_is_frozen(self):
+        """Test that stats reject mutation."""
+        stats = RegulatorStats(total_regulators=2, active_regulators=1)
+        with pytest.raises(ValidationError):
+            stats.total_regulators = 3
+
+
+class TestRegulatorUpdate:
+    """Tests for partial regulator updates."""
+
+    def test_invalid_url_rejected(self):
+        """Test that updates apply the same URL check as creates."""
+        with pytest.raises(ValidationError):
+            RegulatorUpdate(website="www.fda.gov")
+
+    def test_update_round_trips_to_response(self):
+        """Test that an applied update still reads back as a response."""
+        row = {"id": 1, "code": "FDA", "name": "Food and Drug Administration"}
+        update = RegulatorUpdate(
+            website="https://www.fda.gov", api_endpoint="https://api.fda.gov"
+        )
+        row.update(update.model_dump(exclude_unset=True))
+        regulator = RegulatorResponse.model_validate(row)
+        assert regulator.website == "https://www.fda.gov"
+        assert regulator.api_endpoint == "https://api.fda.gov"
+
+
+class TestRegulatorURLs:
+    """Tests for where regulator URL validation applies."""
+
+    def test_create_rejects_scheme_less_url(self):
+        """Test that new regulators must use http(s) URLs."""
+        with pytest.raises(ValidationError):
+            RegulatorCreate(code="FDA", name="FDA", website="www.fda.gov")
+
+    def test_response_reads_legacy_url(self):
+        """Test that rows stored without a URL scheme still load."""
+        row = {"id": 1, "code": "FDA", "name": "FDA", "website": "www.fda.gov"}
+        regulator = RegulatorResponse.model_validate(row)
+        assert regulator.website == "www.fda.gov"
@@ -0,0 +1,126 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for shared validation functions."""
+
+from datetime import date
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+from ashmatics_datamodels.common.validators import (
+    CountryCode,
+    validate_country_code,
+    validate_http_url,
+    validate_iso_date,
+    validate_k_number_format,
+    validate_pma_number_format,
+    validate_product_code,
+)
+
+
+class TestCountryCode:
+    """Tests for validate_country_code."""
+
+    def test_normalizes_case_and_whitespace(self):
+        """Test that codes are stripped and uppercased."""
+        assert validate_country_code(" us ") == "US"
+
+    def test_none_passthrough(self):
+        """Test that None is returned unchanged."""
+        assert validate_country_code(None) is None
+
+    def test_unknown_code_rejected(self):
+        """Test that unknown codes list the accepted values."""
+        with pytest.raises(ValueError, match="Expected one of: AE, AR"):
+            validate_country_code("XX")
+
+    def test_annotated_type(self):
+        """Test the CountryCode annotated type used on schema fields."""
+        adapter = TypeAdapter(CountryCode)
+        assert adapter.validate_python("de") == "DE"
+        assert adapter.validate_python(None) is None
+        with pytest.raises(ValidationError):
+            adapter.validate_python("USA")
+
+
+class TestHttpUrl:
+    """Tests for validate_http_url."""
+
+    @pytest.mark.parametrize(
+        "value", ["https://www.fda.gov", "http://api.fda.gov", "HTTPS://FDA.GOV"]
+    )
+    def test_valid_urls(self, value):
+        """Test that http(s) URLs pass through unchanged."""
+        assert validate_http_url(value) == value
+
+    @pytest.mark.parametrize("value", ["www.fda.gov", "ftp://fda.gov", ""])
+    def test_invalid_urls(self, value):
+        """Test that non-http(s) strings are rejected."""
+        with pytest.raises(ValueError):
+            validate_http_url(value)
+
+
+class TestFDAIdentifiers:
+    """Tests for FDA identifier format validators."""
+
+    @pytest.mark.parametrize("value", ["K240001", "bk1234567", "DEN180067"])
+    def test_valid_k_numbers(self, value):
+        """Test accepted 510(k)/De Novo formats."""
+        assert validate_k_number_format(value) == value.upper()
+
+    @pytest.mark.parametrize("value", ["K12345", "P123456", "K12345678"])
+    def test_invalid_k_numbers(self, value):
+        """Test rejected 510(k) formats."""
+        with pytest.raises(ValueError):
+            validate_k_number_format(value)
+
+    def test_pma_number(self):
+        """Test PMA number normalization and rejection."""
+        assert validate_pma_number_format("p190001") == "P190001"
+        with pytest.raises(ValueError):
+            validate_pma_number_format("P1900011")
+
+    @pytest.mark.parametrize("value", ["qih", " LLZ "])
+    def test_valid_product_codes(self, value):
+        """Test accepted product codes."""
+        assert validate_product_code(value) == value.strip().upper()
+
+    @pytest.mark.parametrize("value", ["QI", "QIHX", "Q1H", "ÄBC"])
+    def test_invalid_product_codes(self, value):
+        """Test rejected product codes."""
+        with pytest.raises(ValueError):
+            validate_product_code(value)
+
+
+class TestIsoDate:
+    """Tests for validate_iso_date."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2024-08-15", date(2024, 8, 15)),
+            ("2024-8-5", date(2024, 8, 5)),
+            ("08/15/2024", date(2024, 8, 15)),
+        ],
+    )
+    def test_accepted_formats(self, value, expected):
+        """Test ISO, non-padded ISO, and US date strings."""
+        assert validate_iso_date(value) == expected
+
+    @pytest.mark.parametrize("value", ["2024-02-30", "2024-W33-4", "15.08.2024"])
+    def test_invalid_dates(self, value):
+        """Test rejected date strings."""
+        with pytest.raises(ValueError):
+            validate_iso_date(value)
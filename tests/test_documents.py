@@ -14,16 +14,19 @@
 
 """Tests for MongoDB document schemas with three-tier structure."""
 
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 
 import pytest
+from pydantic import ValidationError
 
 from ashmatics_datamodels.documents import (
     ContentType,
     DocumentType,
+    EvidenceContent,
     EvidenceDocument,
     EvidenceMetadataContent,
     EvidenceSummary,
+    ManufacturerCardContent,
     ManufacturerCardDocument,
     ManufacturerCardMetadataContent,
     MetadataObjectBase,
@@ -33,12 +36,38 @@ from ashmatics_datamodels.documents import (
     PredicateDeviceInfo,
     ProductCardDocument,
     ProductCardMetadataContent,
+    RegulatoryContent,
     RegulatoryDocument,
     RegulatoryMetadataContent,
+    RegulatorySummary,
     SectionBase,
+    StudyType,
     UseCaseDocument,
     UseCaseMetadataContent,
+    ValidationStudy,
+    validate_document,
 )
+from ashmatics_datamodels.documents.manufacturers import CompanyOverviewSection
+from ashmatics_datamodels.documents.regulatory import PredicatesSection
+
+
+class TestDocumentTypeLiterals:
+    """Tests for the Literal aliases used as document type field types."""
+
+    def test_accepts_enum_and_string(self):
+        """Test that enum members and raw strings both validate to values."""
+        meta = EvidenceMetadataContent(
+            title="Test",
+            document_type=DocumentType.EVIDENCE_DOC,
+            content_type="preprint",
+        )
+        assert meta.document_type == "kb_evidence_doc"
+        assert meta.content_type == ContentType.PREPRINT
+        default = EvidenceMetadataContent(title="Test")
+        assert type(default.document_type) is str
+        assert type(default.content_type) is str
+        with pytest.raises(ValueError):
+            EvidenceMetadataContent(title="Test", content_type="blog_post")
 
 
 class TestMetadataObjectBase:
@@ -52,6 +81,21 @@ class TestMetadataObjectBase:
         assert isinstance(meta.created_at, datetime)
         assert meta.processing_errors == []
 
+    def test_default_timestamps_match(self):
+        """Test that defaulted timestamps share one UTC clock read."""
+        meta = MetadataObjectBase()
+        assert meta.updated_at == meta.created_at
+        assert meta.created_at.tzinfo is not None
+        assert meta.model_fields_set == set()
+
+    def test_backfilled_created_at_keeps_current_updated_at(self):
+        """Test that an explicit created_at does not backdate updated_at."""
+        created = datetime(2020, 1, 1, tzinfo=timezone.utc)
+        meta = MetadataObjectBase(created_at=created)
+        assert meta.created_at == created
+        assert meta.updated_at > created
+        assert meta.model_fields_set == {"created_at"}
+
     def test_with_storage_info(self):
         """Test metadata with storage information."""
         meta = MetadataObjectBase(
@@ -124,6 +168,22 @@ class TestEvidenceDocument:
         assert doc.metadata_content.authors == ["Jane Smith", "John Doe"]
         assert doc.metadata_content.doi == "10.1148/ryai.2024123456"
 
+    def test_default_sections_not_shared(self):
+        """Test that each EvidenceContent gets its own default sections."""
+        first, second = EvidenceContent(), EvidenceContent()
+        assert list(first.sections) == [
+            "1_introduction",
+            "2_methods",
+            "3_results",
+            "4_discussion",
+            "5_conclusion",
+        ]
+        assert isinstance(first.sections["2_methods"], SectionBase)
+        first.sections["2_methods"].subsections["2_1_data"] = SectionBase(
+            title="Data", order=1
+        )
+        assert second.sections["2_methods"].subsections == {}
+
     def test_evidence_summary_from_document(self):
         """Test creating summary from full document."""
         doc = EvidenceDocument(
@@ -180,6 +240,48 @@ class TestRegulatoryDocument:
         assert predicate.k_number == "K190123"
         assert predicate.manufacturer == "Competing AI Inc"
 
+    def test_summary_from_mongo_projection(self):
+        """Test that projected rows validate to the same summary."""
+        doc = RegulatoryDocument(
+            _id="test-regulatory-123",
+            metadata_content=RegulatoryMetadataContent(
+                title="AI-Chest Scanner 510(k) Summary",
+                k_number="K240001",
+                clearance_date=date(2024, 8, 15),
+                device_class="II",
+            ),
+        )
+        record = doc.model_dump(by_alias=True)
+        row = {}
+        for field, path in RegulatorySummary.mongo_projection().items():
+            if field == "_id":
+                row[field] = record["_id"]
+                continue
+            tier, name = path.lstrip("$").split(".")
+            row[field] = record[tier][name]
+        summary = RegulatorySummary.model_validate(row)
+        assert summary == RegulatorySummary.from_document(doc)
+
+    def test_study_type_accepts_enum_and_string(self):
+        """Test that study_type validates StudyType members and raw strings."""
+        study = ValidationStudy(study_type=StudyType.PIVOTAL_STUDY)
+        assert study.study_type == "pivotal_study"
+        assert ValidationStudy(study_type="reader_study").study_type == (
+            StudyType.READER_STUDY
+        )
+        with pytest.raises(ValidationError):
+            ValidationStudy(study_type="case_report")
+
+    def test_default_sections_not_shared(self):
+        """Test that default 510(k) sections are typed and per-instance."""
+        first, second = RegulatoryContent(), RegulatoryContent()
+        predicates = first.sections["3_predicate_devices"]
+        assert isinstance(predicates, PredicatesSection)
+        assert predicates.title == "Predicate Devices"
+        assert list(first.sections)[0] == "0_sponsor"
+        predicates.predicates.append(PredicateDeviceInfo(k_number="K190123"))
+        assert second.sections["3_predicate_devices"].predicates == []
+
 
 class TestModelCardDocument:
     """Tests for kb_aimodel_cards schemas."""
@@ -265,6 +367,32 @@ class TestManufacturerCardDocument:
         assert doc.metadata_content.headquarters == "San Francisco, CA"
         assert doc.metadata_content.founded == "2018"
 
+    def test_default_sections_keep_subclasses(self):
+        """Test that default card sections use their concrete section types."""
+        first = ManufacturerCardContent()
+        second = ManufacturerCardContent()
+        overview = first.sections["company_overview"]
+        assert isinstance(overview, CompanyOverviewSection)
+        assert overview.title == "Company Overview"
+        assert list(first.sections)[-1] == "research_partnerships"
+        assert overview is not second.sections["company_overview"]
+
+    def test_section_fields_survive_round_trip(self):
+        """Test that subclass section fields are kept through JSON."""
+        doc = ManufacturerCardDocument(
+            metadata_content=ManufacturerCardMetadataContent(
+                title="Profile", company_name="Medical AI Corp"
+            ),
+        )
+        doc.content.sections["company_overview"].funding_stage = "Series B"
+        doc.content.sections["custom_notes"] = SectionBase(title="Notes", order=5)
+
+        loaded = ManufacturerCardDocument.model_validate_json(doc.model_dump_json())
+        overview = loaded.content.sections["company_overview"]
+        assert isinstance(overview, CompanyOverviewSection)
+        assert overview.funding_stage == "Series B"
+        assert isinstance(loaded.content.sections["custom_notes"], SectionBase)
+
 
 class TestUseCaseDocument:
     """Tests for kb_use_cases schemas."""
@@ -322,3 +450,42 @@ class TestDocumentSerialization:
         json_data = doc.model_dump(by_alias=True)
         assert "content" in json_data
         assert "sections" in json_data["content"]
+
+
+class TestAnyKBDocument:
+    """Tests for polymorphic document validation."""
+
+    def test_dispatches_on_document_type(self):
+        """Test that raw dicts validate into their concrete document model."""
+        doc = validate_document(
+            {
+                "_id": "reg-1",
+                "metadata_content": {
+                    "document_type": "kb_regulatory_doc",
+                    "content_type": "510k_summary",
+                    "title": "510(k) Summary",
+                    "k_number": "K240001",
+                },
+            }
+        )
+        assert isinstance(doc, RegulatoryDocument)
+        assert doc.metadata_content.k_number == "K240001"
+
+    def test_round_trips_models(self):
+        """Test that built documents and their dumps resolve the same type."""
+        doc = ProductCardDocument(
+            metadata_content=ProductCardMetadataContent(
+                title="Product", product_name="Product", manufacturer="Acme"
+            ),
+        )
+        assert validate_document(doc) is doc
+        assert isinstance(validate_document(doc.model_dump()), ProductCardDocument)
+
+    @pytest.mark.parametrize(
+        "metadata_content",
+        [{"title": "No type"}, {"document_type": "kb_unknown", "title": "Bad"}],
+    )
+    def test_missing_or_unknown_type_rejected(self, metadata_content):
+        """Test that documents without a known document_type are rejected."""
+        with pytest.raises(ValidationError):
+            validate_document({"metadata_content": metadata_content})
@@ -0,0 +1,58 @@
+# Copyright 2025 Asher Informatics PBC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for lazily resolved package exports."""
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+LAZY_PACKAGES = [
+    "ashmatics_datamodels",
+    "ashmatics_datamodels.common",
+    "ashmatics_datamodels.documents",
+]
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_all_exports_resolve(package):
+    """Test that every name in __all__ can be accessed."""
+    module = importlib.import_module(package)
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+
+
+@pytest.mark.parametrize("package", LAZY_PACKAGES)
+def test_unknown_attribute_raises(package):
+    """Test that missing names still raise AttributeError."""
+    module = importlib.import_module(package)
+    with pytest.raises(AttributeError):
+        module.DoesNotExist  # noqa: B018
+
+
+def test_package_import_is_lazy():
+    """Test that importing packages does not load schema submodules."""
+    code = (
+        "import sys, ashmatics_datamodels, ashmatics_datamodels.common,"
+        " ashmatics_datamodels.documents;"
+        "print(sorted(m for m in sys.modules if m.startswith('ashmatics')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert "ashmatics_datamodels.common.regulators" not in result.stdout
+    assert "ashmatics_datamodels.common.frameworks" not in result.stdout
+    assert "ashmatics_datamodels.documents.regulatory" not in result.stdout